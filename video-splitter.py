@@ -4,6 +4,9 @@ Video Splitter Tool
 Splits long videos into 30-minute segments and extracts audio files.
 """
 
+import asyncio
+import functools
+import json
 import os
 import sys
 import subprocess
@@ -12,24 +15,27 @@ from pathlib import Path
 import argparse
 import yt_dlp
 import re
-from urllib.parse import urlparse
+
+
+# Matches the YouTube hosts the old urlparse-based check accepted
+_YT_URL_RE = re.compile(r'^https?://(www\.|m\.)?(youtube\.com|youtu\.be)/')
 
 
 def is_youtube_url(url):
     """Check if the given URL is a YouTube URL."""
-    youtube_domains = ['youtube.com', 'youtu.be', 'www.youtube.com', 'm.youtube.com']
-    try:
-        parsed = urlparse(url)
-        return parsed.netloc in youtube_domains
-    except:
-        return False
+    return bool(_YT_URL_RE.match(url))
+
+
+# Precompiled once at import instead of on every filename
+_FNAME_BAD = re.compile(r'[<>:"/\\|?*]')
+_FNAME_WS = re.compile(r'\s+')
 
 
 def clean_filename(filename):
     """Clean filename to be filesystem safe."""
     # Remove or replace problematic characters
-    filename = re.sub(r'[<>:"/\\|?*]', '', filename)
-    filename = re.sub(r'[\s]+', '_', filename)
+    filename = _FNAME_BAD.sub('', filename)
+    filename = _FNAME_WS.sub('_', filename)
     return filename
 
 
@@ -46,98 +52,196 @@ def download_youtube_video(url, output_dir=None):
     # Find ffmpeg path
     ffmpeg_path = check_ffmpeg()
     
-    # Configure yt-dlp options
+    # Configure yt-dlp options; restrictfilenames makes yt-dlp sanitize the
+    # title itself, so no second pass with a cleaned output template is needed
     ydl_opts = {
         'format': '137+140/136+140/135+140/best',  # Try 1080p, 720p, 480p with audio, fallback to best
-        'outtmpl': str(output_dir / '%(title)s.%(ext)s'),
+        'outtmpl': {'default': str(output_dir / '%(title).200B.%(ext)s')},
         'noplaylist': True,
         'merge_output_format': 'mp4',  # Merge to mp4 format
+        'restrictfilenames': True,
     }
-    
+
     # Set ffmpeg path if found
     if ffmpeg_path:
         ydl_opts['ffmpeg_location'] = ffmpeg_path
-    
+
     try:
+        # A single context extracts info and downloads in one pass, avoiding
+        # a second round trip to YouTube's API
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            # Get video info first
-            info = ydl.extract_info(url, download=False)
-            title = info['title']
-            clean_title = clean_filename(title)
-            
-            # Update output template with clean filename
-            ydl_opts['outtmpl'] = str(output_dir / f'{clean_title}.%(ext)s')
-            
-            # Download with updated options
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl2:
-                ydl2.download([url])
-            
-            # Find the downloaded file
-            for ext in ['mp4', 'webm', 'mkv', 'avi']:
-                downloaded_file = output_dir / f'{clean_title}.{ext}'
-                if downloaded_file.exists():
-                    return downloaded_file
-            
+            info = ydl.extract_info(url, download=True)
+            downloaded_file = Path(ydl.prepare_filename(info))
+
+            # Merged downloads end up as .mp4 regardless of the original ext
+            merged_file = downloaded_file.with_suffix('.mp4')
+            if merged_file.exists():
+                return merged_file
+            if downloaded_file.exists():
+                return downloaded_file
+
             return None
-            
+
     except Exception as e:
         print(f"Error downloading video: {e}")
         return None
 
 
+@functools.lru_cache(maxsize=1)
 def check_ffmpeg():
-    """Check if FFmpeg is available in the system."""
-    # Try different possible locations for ffmpeg
-    ffmpeg_paths = [
-        'ffmpeg',
+    """Check if FFmpeg is available in the system.
+
+    The result is cached, so repeated callers (e.g. pick_audio_format per
+    segment) don't re-probe the filesystem.
+    """
+    # A $PATH lookup plus an executable-bit check covers what the old
+    # -version subprocess probes did, without any fork+exec
+    fallback_paths = [
         '/usr/local/bin/ffmpeg',
         os.path.expanduser('~/bin/ffmpeg')
     ]
-    
-    for ffmpeg_path in ffmpeg_paths:
-        try:
-            subprocess.run([ffmpeg_path, '-version'], capture_output=True, check=True)
-            return ffmpeg_path
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            continue
-    
-    return None
 
+    return shutil.which('ffmpeg') or next(
+        (p for p in fallback_paths if os.path.isfile(p) and os.access(p, os.X_OK)),
+        None
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def check_ffprobe():
+    """Check if ffprobe is available in the system.
+
+    Cached for the same reason as check_ffmpeg.
+    """
+    fallback_paths = [
+        '/usr/local/bin/ffprobe',
+        os.path.expanduser('~/bin/ffprobe')
+    ]
+
+    return shutil.which('ffprobe') or next(
+        (p for p in fallback_paths if os.path.isfile(p) and os.access(p, os.X_OK)),
+        None
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _probe_media_cached(path_str, mtime_ns):
+    """Run the actual ffprobe call for probe_media; keyed on path + mtime."""
+    ffprobe_path = check_ffprobe()
+    if not ffprobe_path:
+        return None
 
-def get_video_duration(video_path, ffmpeg_path):
-    """Get video duration in seconds using FFmpeg."""
     try:
-        # Use FFmpeg to get duration info
         cmd = [
-            ffmpeg_path, '-i', video_path, '-f', 'null', '-'
+            ffprobe_path, '-v', 'error',
+            '-print_format', 'json',
+            '-show_format',
+            '-show_streams',
+            path_str
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        # Parse duration from FFmpeg output
-        output = result.stderr
-        duration_line = None
-        for line in output.split('\n'):
-            if 'Duration:' in line:
-                duration_line = line
-                break
-        
-        if duration_line:
-            # Extract duration in format HH:MM:SS.ss
-            import re
-            duration_match = re.search(r'Duration: (\d{2}):(\d{2}):(\d{2})\.(\d{2})', duration_line)
-            if duration_match:
-                hours = int(duration_match.group(1))
-                minutes = int(duration_match.group(2))
-                seconds = int(duration_match.group(3))
-                centiseconds = int(duration_match.group(4))
-                
-                total_seconds = hours * 3600 + minutes * 60 + seconds + centiseconds / 100
-                return total_seconds
-        
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        return json.loads(result.stdout)
+    except (subprocess.CalledProcessError, json.JSONDecodeError):
+        return None
+
+
+def probe_media(video_path):
+    """Probe format and stream metadata for a media file in one ffprobe run.
+
+    Results are cached per (path, mtime), so duration and codec lookups on
+    the same file cost a single process launch between them.
+    """
+    video_path = Path(video_path)
+    try:
+        mtime_ns = video_path.stat().st_mtime_ns
+    except OSError:
         return None
-    except (subprocess.CalledProcessError, ValueError):
+
+    return _probe_media_cached(str(video_path), mtime_ns)
+
+
+def get_video_duration(video_path):
+    """Get video duration in seconds from the cached container metadata."""
+    info = probe_media(video_path)
+    if not info:
+        return None
+
+    try:
+        return float(info['format']['duration'])
+    except (KeyError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def detect_nvenc(ffmpeg_path):
+    """Check whether this FFmpeg build exposes the h264_nvenc encoder."""
+    try:
+        result = subprocess.run(
+            [ffmpeg_path, '-hide_banner', '-encoders'],
+            capture_output=True, text=True, check=True
+        )
+        return 'h264_nvenc' in result.stdout
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+
+
+def available_cpus():
+    """Number of CPUs this process is actually allowed to run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        # sched_getaffinity is Linux-only
+        return os.cpu_count() or 2
+
+
+def pick_video_codec_args(ffmpeg_path, reencode=False):
+    """Choose input/output video codec arguments for segment cutting.
+
+    Stream copy by default; when a re-encode is requested (e.g. for
+    frame-accurate segment boundaries), use NVENC hardware encoding if the
+    FFmpeg build exposes it, otherwise fall back to libx264.
+    """
+    if not reencode:
+        return [], ['-c', 'copy']
+
+    if detect_nvenc(ffmpeg_path):
+        input_args = ['-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda']
+        codec_args = ['-c:v', 'h264_nvenc', '-preset', 'p4', '-b:v', '5M', '-c:a', 'copy']
+        return input_args, codec_args
+
+    return [], ['-c:v', 'libx264', '-c:a', 'copy']
+
+
+def get_audio_codec(video_path):
+    """Get the codec name of the first audio stream, or None."""
+    info = probe_media(video_path)
+    if not info:
         return None
 
+    for stream in info.get('streams', []):
+        if stream.get('codec_type') == 'audio':
+            return stream.get('codec_name')
+
+    return None
+
+
+def pick_audio_format(video_path, mp3_force=False):
+    """Choose the audio output suffix and codec arguments for a source.
+
+    When the source audio is already AAC or MP3 it is stream-copied into a
+    matching container instead of being re-encoded, which skips the
+    CPU-heavy libmp3lame pass entirely.
+    """
+    if not mp3_force:
+        codec = get_audio_codec(video_path)
+        if codec == 'aac':
+            return '.m4a', ['-c:a', 'copy']
+        if codec == 'mp3':
+            return '.mp3', ['-c:a', 'copy']
+
+    # Fall back to a full MP3 re-encode
+    return '.mp3', ['-acodec', 'mp3', '-ab', '320k']
+
 
 def create_organized_directories(video_path):
     """Create organized directory structure for video files."""
@@ -164,52 +268,139 @@ def create_organized_directories(video_path):
     }
 
 
-def split_video(video_path, directories, start_time, duration, part_num, ffmpeg_path):
-    """Split video into segments with both video and audio output."""
+def run_ffmpeg_jobs(cmds):
+    """Run several FFmpeg commands concurrently and wait for all of them."""
+    procs = [
+        subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        for cmd in cmds
+    ]
+
+    all_ok = True
+    for proc in procs:
+        _, stderr = proc.communicate()
+        if proc.returncode != 0:
+            message = stderr.decode(errors='replace').strip() if stderr else 'unknown error'
+            print(f"FFmpeg failed (exit {proc.returncode}): {message.splitlines()[-1] if message else message}")
+            all_ok = False
+
+    return all_ok
+
+
+def build_split_cmd(video_path, directories, start_time, duration, part_num, ffmpeg_path,
+                    mp3_force=False, reencode=False, threads=2):
+    """Build the fused FFmpeg command for one video+audio segment.
+
+    Seeks are done on the input side (-ss before -i), so ffmpeg jumps via
+    the container index instead of decoding up to the start point. Cuts may
+    snap to the nearest keyframe, which is negligible for 30-minute parts.
+    """
     video_stem = Path(video_path).stem
-    
+    audio_suffix, audio_codec_args = pick_audio_format(video_path, mp3_force)
+    video_input_args, video_codec_args = pick_video_codec_args(ffmpeg_path, reencode)
+
     # Output file paths in organized directories
     video_output = directories['mp4'] / f"{video_stem}_part{part_num}.mp4"
-    audio_output = directories['mp3'] / f"{video_stem}_part{part_num}.mp3"
-    
-    # Split video (with audio)
-    video_cmd = [
-        ffmpeg_path, '-i', str(video_path),
+    audio_output = directories['mp3'] / f"{video_stem}_part{part_num}{audio_suffix}"
+
+    # If the complete audio extract already exists, the audio part can be
+    # stream-copied out of it instead of re-decoding the source video
+    full_audio = directories['mp3'] / f"{video_stem}{audio_suffix}"
+    cut_from_full_audio = full_audio.exists()
+
+    # One invocation with two mapped outputs: the video input is demuxed once
+    # and shared between the video segment and the audio extract
+    split_cmd = [
+        ffmpeg_path, '-hide_banner', '-loglevel', 'error',
+        *video_input_args,
         '-ss', str(start_time),
+        '-noaccurate_seek',
+        '-i', str(video_path),
+    ]
+    if cut_from_full_audio:
+        split_cmd += [
+            '-ss', str(start_time),
+            '-noaccurate_seek',
+            '-i', str(full_audio),
+        ]
+    split_cmd += [
+        # First output: video segment
         '-t', str(duration),
-        '-c', 'copy',
+        '-map', '0',
+        *video_codec_args,
         '-avoid_negative_ts', 'make_zero',
+        '-threads', str(threads),  # Keep total thread count near core count when run in parallel
         str(video_output),
-        '-y'
-    ]
-    
-    # Extract audio
-    audio_cmd = [
-        ffmpeg_path, '-i', str(video_path),
-        '-ss', str(start_time),
+        # Second output: audio-only segment
         '-t', str(duration),
-        '-vn',  # No video
-        '-acodec', 'mp3',
-        '-ab', '320k',  # High quality audio
+    ]
+    if cut_from_full_audio:
+        split_cmd += ['-map', '1:a', '-c', 'copy']
+    else:
+        split_cmd += [
+            '-map', '0:a',
+            '-vn',  # No video
+            *audio_codec_args,
+            '-threads', '1',  # libmp3lame is single-threaded anyway
+        ]
+    split_cmd += [
         str(audio_output),
         '-y'
     ]
-    
-    try:
-        print(f"Creating part {part_num}...")
-        
-        # Create video segment
-        subprocess.run(video_cmd, capture_output=True, check=True)
-        print(f"  ✓ MP4/{video_output.name}")
-        
-        # Extract audio
-        subprocess.run(audio_cmd, capture_output=True, check=True)
-        print(f"  ✓ MP3/{audio_output.name}")
-        
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error creating part {part_num}: {e}")
-        return False
+
+    return split_cmd, video_output, audio_output
+
+
+async def split_video_async(video_path, directories, start_time, duration, part_num, ffmpeg_path,
+                            mp3_force=False, reencode=False, threads=2, progress_callback=None):
+    """Split one video+audio segment and return a structured result.
+
+    -progress pipe:1 makes ffmpeg emit machine-readable key=value lines on
+    stdout, which are consumed without blocking so many segments can run
+    concurrently. Nothing is printed here — concurrent workers writing to
+    stdout serialize on its lock and interleave their output — so status
+    goes back to the orchestrator as a dict: {'part', 'video', 'audio',
+    'ok', 'error'}. Progress percentages go to progress_callback if given.
+    """
+    split_cmd, video_output, audio_output = build_split_cmd(
+        video_path, directories, start_time, duration, part_num, ffmpeg_path,
+        mp3_force, reencode, threads
+    )
+    split_cmd = split_cmd[:1] + ['-progress', 'pipe:1', '-nostats'] + split_cmd[1:]
+
+    proc = await asyncio.create_subprocess_exec(
+        *split_cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+
+    total_us = duration * 1_000_000
+    while True:
+        line = await proc.stdout.readline()
+        if not line:
+            break
+        if progress_callback is not None and line.startswith(b'out_time_ms='):
+            try:
+                # despite the name, out_time_ms is in microseconds
+                out_time_us = int(line.split(b'=', 1)[1])
+            except ValueError:
+                continue
+            progress_callback(part_num, min(100, out_time_us / total_us * 100))
+
+    stderr = await proc.stderr.read()
+    await proc.wait()
+
+    result = {
+        'part': part_num,
+        'video': video_output,
+        'audio': audio_output,
+        'ok': proc.returncode == 0,
+        'error': None
+    }
+    if proc.returncode != 0:
+        message = stderr.decode(errors='replace').strip() if stderr else 'unknown error'
+        result['error'] = message.splitlines()[-1] if message else message
+
+    return result
 
 
 def process_video(video_path, ffmpeg_path):
@@ -221,9 +412,13 @@ def process_video(video_path, ffmpeg_path):
         return False
     
     print(f"Processing: {video_path.name}")
-    
+
     # Get video duration
-    duration = get_video_duration(video_path, ffmpeg_path)
+    if not check_ffprobe():
+        print("Error: ffprobe is not installed or not found in PATH.")
+        return False
+
+    duration = get_video_duration(video_path)
     if duration is None:
         print("Error: Could not get video duration.")
         return False
@@ -232,60 +427,83 @@ def process_video(video_path, ffmpeg_path):
     print(f"Video duration: {duration_minutes:.1f} minutes")
     
     # Create output directory
-    output_dir = create_output_directory(video_path)
-    print(f"Output directory: {output_dir}")
-    
-    # Calculate segments
+    directories = create_organized_directories(video_path)
+
+    # Calculate segments up front so they can be dispatched in parallel
     segment_duration = 30 * 60  # 30 minutes in seconds
-    current_time = 0
-    part_num = 1
-    
-    while current_time < duration:
-        remaining_time = duration - current_time
-        
-        if remaining_time <= segment_duration:
-            # Last segment - use all remaining time
-            segment_time = remaining_time
+    n_full, remainder = divmod(duration, segment_duration)
+    n_full = int(n_full)
+
+    tasks = [(i * segment_duration, segment_duration, i + 1) for i in range(n_full)]
+    if remainder > 0:
+        tasks.append((n_full * segment_duration, remainder, n_full + 1))
+
+    # Each segment is an independent ffmpeg invocation; half the cores keeps
+    # the concurrent processes from thrashing disk I/O, and the per-job
+    # thread budget keeps the total thread count near the core count
+    cpus = available_cpus()
+    max_workers = max(1, cpus // 2)
+    threads = max(1, cpus // max_workers)
+
+    async def run_segments():
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def run_one(start, seg_dur, num):
+            async with semaphore:
+                return await split_video_async(video_path, directories, start, seg_dur, num,
+                                               ffmpeg_path, threads=threads)
+
+        return await asyncio.gather(*[run_one(*task) for task in tasks])
+
+    print(f"Creating {len(tasks)} segments...")
+    results = asyncio.run(run_segments())
+
+    # One batched report instead of interleaved per-worker prints
+    for result in sorted(results, key=lambda r: r['part']):
+        if result['ok']:
+            print(f"  ✓ part {result['part']}: MP4/{result['video'].name}  MP3/{result['audio'].name}")
         else:
-            # Regular 30-minute segment
-            segment_time = segment_duration
-        
-        success = split_video(video_path, output_dir, current_time, segment_time, part_num, ffmpeg_path)
-        if not success:
-            return False
-        
-        current_time += segment_time
-        part_num += 1
-    
-    print(f"\nCompleted! Generated {part_num - 1} segments in {output_dir}")
+            print(f"  ✗ part {result['part']}: {result['error']}")
+
+    if not all(result['ok'] for result in results):
+        return False
+
+    print(f"\nCompleted! Generated {len(tasks)} segments in {directories['main']}")
     return True
 
 
-def extract_full_audio(video_path, directories, ffmpeg_path):
-    """Extract complete audio from video to organized structure."""
+def build_full_audio_cmd(video_path, directories, ffmpeg_path, mp3_force=False):
+    """Build the FFmpeg command that extracts the complete audio track."""
     video_path = Path(video_path)
-    audio_output = directories['mp3'] / f"{video_path.stem}.mp3"
-    
+    audio_suffix, audio_codec_args = pick_audio_format(video_path, mp3_force)
+    audio_output = directories['mp3'] / f"{video_path.stem}{audio_suffix}"
+
     audio_cmd = [
-        ffmpeg_path, '-i', str(video_path),
+        ffmpeg_path, '-hide_banner', '-loglevel', 'error',
+        '-i', str(video_path),
         '-vn',  # No video
-        '-acodec', 'mp3',
-        '-ab', '320k',  # High quality audio
+        *audio_codec_args,
         str(audio_output),
         '-y'  # Overwrite if exists
     ]
-    
-    try:
-        print(f"Extracting complete audio...")
-        subprocess.run(audio_cmd, capture_output=True, check=True)
-        print(f"  ✓ MP3/{audio_output.name}")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error extracting audio: {e}")
+
+    return audio_cmd, audio_output
+
+
+def extract_full_audio(video_path, directories, ffmpeg_path, mp3_force=False):
+    """Extract complete audio from video to organized structure."""
+    audio_cmd, audio_output = build_full_audio_cmd(video_path, directories, ffmpeg_path, mp3_force)
+
+    print(f"Extracting complete audio...")
+    if not run_ffmpeg_jobs([audio_cmd]):
+        print(f"Error extracting audio")
         return False
 
+    print(f"  ✓ MP3/{audio_output.name}")
+    return True
+
 
-def process_video_no_split(video_path, ffmpeg_path, audio_only=False):
+def process_video_no_split(video_path, ffmpeg_path, audio_only=False, mp3_force=False):
     """Process video without splitting - just extract complete audio."""
     video_path = Path(video_path).resolve()
     
@@ -301,12 +519,16 @@ def process_video_no_split(video_path, ffmpeg_path, audio_only=False):
     # Move original video to main directory
     original_video = directories['main'] / video_path.name
     if not original_video.exists():
-        import shutil
-        shutil.move(str(video_path), str(original_video))
+        try:
+            # Same-filesystem case: a single atomic rename syscall
+            os.replace(video_path, original_video)
+        except OSError:
+            # Cross-device move falls back to copy + delete
+            shutil.move(str(video_path), str(original_video))
         print(f"Moved original video to: {directories['main'].name}/")
     
     # Extract complete audio using the moved video
-    success = extract_full_audio(original_video, directories, ffmpeg_path)
+    success = extract_full_audio(original_video, directories, ffmpeg_path, mp3_force)
     if not success:
         return False
     
@@ -314,7 +536,8 @@ def process_video_no_split(video_path, ffmpeg_path, audio_only=False):
     return True
 
 
-def process_video_with_split(video_path, ffmpeg_path, audio_only=False):
+def process_video_with_split(video_path, ffmpeg_path, audio_only=False, mp3_force=False,
+                             reencode=False, container='mp4'):
     """Process video with splitting into 30-minute segments."""
     video_path = Path(video_path).resolve()
     
@@ -330,79 +553,153 @@ def process_video_with_split(video_path, ffmpeg_path, audio_only=False):
     # Move original video to main directory
     original_video = directories['main'] / video_path.name
     if not original_video.exists():
-        import shutil
-        shutil.move(str(video_path), str(original_video))
+        try:
+            # Same-filesystem case: a single atomic rename syscall
+            os.replace(video_path, original_video)
+        except OSError:
+            # Cross-device move falls back to copy + delete
+            shutil.move(str(video_path), str(original_video))
         print(f"Moved original video to: {directories['main'].name}/")
     
-    # Always extract complete audio first
-    print("Step 1: Extracting complete audio...")
-    extract_success = extract_full_audio(original_video, directories, ffmpeg_path)
-    if not extract_success:
-        return False
-    
-    # Then split into segments
-    print("Step 2: Creating 30-minute segments...")
-    
     # Get video duration
-    duration = get_video_duration(original_video, ffmpeg_path)
+    if not check_ffprobe():
+        print("Error: ffprobe is not installed or not found in PATH.")
+        return False
+
+    duration = get_video_duration(original_video)
     if duration is None:
         print("Error: Could not get video duration.")
         return False
-    
+
     duration_minutes = duration / 60
     print(f"Video duration: {duration_minutes:.1f} minutes")
-    
-    # Calculate segments
+
+    # Let FFmpeg's segment muxer cut all parts in a single pass instead of
+    # spawning one process per 30-minute chunk
+    video_stem = original_video.stem
     segment_duration = 30 * 60  # 30 minutes in seconds
-    current_time = 0
-    part_num = 1
-    
-    while current_time < duration:
-        remaining_time = duration - current_time
-        
-        if remaining_time <= segment_duration:
-            # Last segment - use all remaining time
-            segment_time = remaining_time
-        else:
-            # Regular 30-minute segment
-            segment_time = segment_duration
-        
-        if audio_only:
-            # Only create audio segments
-            success = split_audio_only(original_video, directories, current_time, segment_time, part_num, ffmpeg_path)
-        else:
-            # Create both video and audio segments
-            success = split_video(original_video, directories, current_time, segment_time, part_num, ffmpeg_path)
-        
-        if not success:
+
+    # The complete-audio extraction is independent of the segment passes, so
+    # it joins the same concurrent batch
+    full_audio_cmd, full_audio_output = build_full_audio_cmd(original_video, directories, ffmpeg_path, mp3_force)
+    segment_cmds = [full_audio_cmd]
+
+    video_suffix = '.ts' if container == 'ts' else '.mp4'
+    if not audio_only:
+        # Video segments (stream copy unless a re-encode was requested)
+        video_input_args, video_codec_args = pick_video_codec_args(ffmpeg_path, reencode)
+        video_cmd = [
+            ffmpeg_path, '-hide_banner', '-loglevel', 'error',
+            *video_input_args, '-i', str(original_video),
+            *video_codec_args,
+            '-map', '0',
+            '-f', 'segment',
+            '-segment_time', str(segment_duration),
+            '-segment_start_number', '1',
+            '-reset_timestamps', '1',
+            '-avoid_negative_ts', 'make_zero',
+        ]
+        if container == 'ts':
+            # MPEG-TS parts can be concatenated bit-exactly with plain cat,
+            # which MP4 cannot (the moov atom breaks); H.264 needs the
+            # Annex B bitstream filter on the way in
+            video_cmd += ['-segment_format', 'mpegts', '-bsf:v', 'h264_mp4toannexb']
+        video_cmd += [
+            str(directories['mp4'] / f"{video_stem}_part%03d{video_suffix}"),
+            '-y'
+        ]
+        segment_cmds.append(video_cmd)
+
+    # Audio segments. When the source audio is copyable, cutting straight
+    # from the video is already encode-free and can join the first batch;
+    # otherwise the MP3 encode happens once (the complete extract) and the
+    # parts are stream-copied out of that file afterwards.
+    audio_suffix, audio_codec_args = pick_audio_format(original_video, mp3_force)
+    audio_is_copy = audio_codec_args == ['-c:a', 'copy']
+    audio_segment_output = str(directories['mp3'] / f"{video_stem}_part%03d{audio_suffix}")
+
+    if audio_is_copy:
+        audio_cmd = [
+            ffmpeg_path, '-hide_banner', '-loglevel', 'error',
+            '-i', str(original_video),
+            '-vn',  # No video
+            *audio_codec_args,
+            '-f', 'segment',
+            '-segment_time', str(segment_duration),
+            '-segment_start_number', '1',
+        ]
+        if audio_suffix == '.m4a':
+            # The segment muxer cannot guess the format from an .m4a extension
+            audio_cmd += ['-segment_format', 'mp4']
+        audio_cmd += [audio_segment_output, '-y']
+        segment_cmds.append(audio_cmd)
+
+    print("Extracting complete audio and creating 30-minute segments...")
+    if not run_ffmpeg_jobs(segment_cmds):
+        print("Error creating segments")
+        return False
+
+    if not audio_is_copy:
+        # Cut the parts from the finished complete extract with -c copy;
+        # MP3 cuts land on ~26 ms frame boundaries, negligible at this size
+        audio_cmd = [
+            ffmpeg_path, '-hide_banner', '-loglevel', 'error',
+            '-i', str(full_audio_output),
+            '-c', 'copy',
+            '-f', 'segment',
+            '-segment_time', str(segment_duration),
+            '-segment_start_number', '1',
+            audio_segment_output,
+            '-y'
+        ]
+        if not run_ffmpeg_jobs([audio_cmd]):
+            print("Error creating segments")
             return False
-        
-        current_time += segment_time
-        part_num += 1
-    
-    print(f"\nCompleted! Original video + complete audio + {part_num - 1} segments in {directories['main']}")
+
+    print(f"  ✓ MP3/{full_audio_output.name}")
+    mp4_parts = sorted(directories['mp4'].glob(f"{video_stem}_part*{video_suffix}"))
+    mp3_parts = sorted(directories['mp3'].glob(f"{video_stem}_part*{audio_suffix}"))
+    for part in mp4_parts:
+        print(f"  ✓ MP4/{part.name}")
+    for part in mp3_parts:
+        print(f"  ✓ MP3/{part.name}")
+
+    part_count = len(mp3_parts) if audio_only else len(mp4_parts)
+    print(f"\nCompleted! Original video + complete audio + {part_count} segments in {directories['main']}")
     return True
 
 
-def split_audio_only(video_path, directories, start_time, duration, part_num, ffmpeg_path):
+def split_audio_only(video_path, directories, start_time, duration, part_num, ffmpeg_path, mp3_force=False):
     """Split audio only into segments."""
     video_stem = Path(video_path).stem
-    
+    audio_suffix, audio_codec_args = pick_audio_format(video_path, mp3_force)
+
     # Output audio file path in MP3 directory
-    audio_output = directories['mp3'] / f"{video_stem}_part{part_num}.mp3"
-    
-    # Extract audio segment
+    audio_output = directories['mp3'] / f"{video_stem}_part{part_num}{audio_suffix}"
+
+    # Prefer cutting from the complete audio extract with a stream copy;
+    # re-decode the source video only when that file doesn't exist yet
+    full_audio = directories['mp3'] / f"{video_stem}{audio_suffix}"
+    if full_audio.exists():
+        audio_input = full_audio
+        audio_codec_args = ['-c', 'copy']
+    else:
+        audio_input = video_path
+
+    # Extract audio segment (input-side seek; may snap to a keyframe)
     audio_cmd = [
-        ffmpeg_path, '-i', str(video_path),
+        ffmpeg_path, '-hide_banner', '-loglevel', 'error',
         '-ss', str(start_time),
+        '-noaccurate_seek',
+        '-i', str(audio_input),
         '-t', str(duration),
         '-vn',  # No video
-        '-acodec', 'mp3',
-        '-ab', '320k',  # High quality audio
+        *audio_codec_args,
+        '-threads', '1',  # libmp3lame is single-threaded anyway
         str(audio_output),
         '-y'
     ]
-    
+
     try:
         print(f"Creating audio part {part_num}...")
         subprocess.run(audio_cmd, capture_output=True, check=True)
@@ -436,6 +733,22 @@ def main():
         action="store_true",
         help="Only output audio files (keep original video)"
     )
+    parser.add_argument(
+        "--mp3-force",
+        action="store_true",
+        help="Always re-encode audio to MP3 instead of stream-copying AAC/MP3 sources"
+    )
+    parser.add_argument(
+        "--reencode",
+        action="store_true",
+        help="Re-encode video at segment boundaries (uses NVENC when available)"
+    )
+    parser.add_argument(
+        "--container",
+        choices=["mp4", "ts"],
+        default="mp4",
+        help="Segment container; ts produces MPEG-TS parts that concatenate with plain cat"
+    )
     
     args = parser.parse_args()
     
@@ -474,9 +787,10 @@ def main():
     
     # Process the video
     if args.no_split:
-        success = process_video_no_split(video_file, ffmpeg_path, args.audio_only)
+        success = process_video_no_split(video_file, ffmpeg_path, args.audio_only, args.mp3_force)
     else:
-        success = process_video_with_split(video_file, ffmpeg_path, args.audio_only)
+        success = process_video_with_split(video_file, ffmpeg_path, args.audio_only, args.mp3_force,
+                                           args.reencode, args.container)
     
     sys.exit(0 if success else 1)
 